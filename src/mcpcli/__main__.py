@@ -1,37 +1,48 @@
 # src/__main__.py
 import argparse
-import asyncio
-import json
+import functools
+import io
 import logging
 import os
 import signal
 import sys
-from typing import List
+import threading
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List
 
 import anyio
+import orjson
 
 # Rich imports
 from rich import print
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt
+from rich.console import Console, Group
+from rich.text import Text
 
-from mcpcli.chat_handler import handle_chat_mode
 from mcpcli.config import load_config
+from mcpcli.input_handler import get_input
 from mcpcli.messages.send_ping import send_ping
 from mcpcli.messages.send_prompts import send_prompts_list
 from mcpcli.messages.send_resources import send_resources_list
-from mcpcli.messages.send_initialize_message import send_initialize
 from mcpcli.messages.send_call_tool import send_call_tool
 from mcpcli.messages.send_tools_list import send_tools_list
-from mcpcli.transport.sse.sse_client import sse_client
-from mcpcli.transport.sse.sse_server_parameters import SSEServerParameters
-from mcpcli.transport.stdio.stdio_client import stdio_client
-from mcpcli.transport.stdio.stdio_server_parameters import StdioServerParameters
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
 
 # Default path for the configuration file
 DEFAULT_CONFIG_FILE = "server_config.json"
 
+# Commands accepted on the command line (single command mode)
+_COMMAND_CHOICES = ("ping", "list-tools", "list-resources", "list-prompts")
+
+# Default model for each supported LLM provider
+_DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "ollama": "qwen2.5-coder",
+    "amazon": "claude-3.5-sonnet",
+}
+_PROVIDER_CHOICES = tuple(_DEFAULT_MODELS)
+
 # Configure logging
 logging.basicConfig(
     level=logging.CRITICAL,
@@ -39,228 +50,411 @@ logging.basicConfig(
     stream=sys.stderr,
 )
 
+_HELP_MD = """
+# Available Commands
 
-def signal_handler(sig, frame):
-    # Ignore subsequent SIGINT signals
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+- **ping**: Check if server is responsive
+- **list-tools**: Display available tools
+- **list-resources**: Display available resources
+- **list-prompts**: Display available prompts
+- **chat**: Enter chat mode
+- **clear**: Clear the screen
+- **help**: Show this help message
+- **quit/exit**: Exit the program
 
-    # pretty exit
-    print("\n[bold red]Goodbye![/bold red]")
+**Note:** Commands use dashes (e.g., `list-tools` not `list tools`).
+"""
 
-    # Immediately and forcibly kill the process
-    os.kill(os.getpid(), signal.SIGKILL)
+_WELCOME_TEXT = """
+# Welcome to the Interactive MCP Command-Line Tool (Multi-Server Mode)
 
+Type 'help' for available commands or 'quit' to exit.
+"""
 
-# signal handler
-signal.signal(signal.SIGINT, signal_handler)
+# prompt_toolkit formatted text, as (style, text) pairs
+_COMMAND_PROMPT = [("", "\n"), ("ansigreen bold", ">"), ("", " ")]
+_TOOL_NAME_PROMPT = [("ansimagenta bold", "Enter tool name"), ("", ": ")]
+_TOOL_ARGS_PROMPT = [
+    ("ansimagenta bold", "Enter tool arguments as JSON (e.g., {'key': 'value'})"),
+    ("", ": "),
+]
+
+# Status lines shown while waiting on the servers, parsed once
+_STATUS_PING = Text.from_markup("[cyan]\nPinging Servers...[/cyan]")
+_STATUS_TOOLS = Text.from_markup("[cyan]\nFetching Tools List from all servers...[/cyan]")
+_STATUS_RESOURCES = Text.from_markup(
+    "[cyan]\nFetching Resources List from all servers...[/cyan]"
+)
+_STATUS_PROMPTS = Text.from_markup(
+    "[cyan]\nFetching Prompts List from all servers...[/cyan]"
+)
 
+# ANSI "erase display" + "cursor home"
+_CLEAR = "\x1b[2J\x1b[H"
+
+# Dedicated console for batched panel output
+_console = Console(highlight=False)
+
+# call-tool arguments shorter than this are pretty-printed before display
+_PRETTY_ARGS_LIMIT = 2048
+
+_PING_OK_MD = "## Server {server_num} Ping Result\n\n✅ **Server is up and running**"
+_PING_FAILED_MD = "## Server {server_num} Ping Result\n\n❌ **Server ping failed**"
+
+
+def _clear():
+    """Clear the terminal without spawning a shell."""
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
+
+
+@functools.cache
+def _rich():
+    """Import the markdown renderables on first use.
+
+    rich.markdown pulls in markdown-it and Pygments, which are not needed
+    for ``--help`` or argument errors.
+    """
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    return Markdown, Panel
+
+
+# Static panels are built once so the markdown is only parsed on first use
+@functools.cache
+def _help_panel() -> "Panel":
+    Markdown, Panel = _rich()
+    return Panel(Markdown(_HELP_MD), style="yellow")
+
+
+@functools.cache
+def _welcome_panel() -> "Panel":
+    Markdown, Panel = _rich()
+    return Panel(Markdown(_WELCOME_TEXT), style="bold cyan")
+
+
+@functools.lru_cache(maxsize=8)
+def _chat_banner(provider: str, model: str) -> "Panel":
+    """Build (and cache) the chat mode banner for a provider/model pair."""
+    Markdown, Panel = _rich()
+    chat_info_text = (
+        "Welcome to the Chat!\n\n"
+        f"**Provider:** {provider}  |  **Model:** {model}\n\n"
+        "Type 'exit' to quit."
+    )
+    return Panel(
+        Markdown(chat_info_text),
+        style="bold cyan",
+        title="Chat Mode",
+        title_align="center",
+    )
+
+
+def _page(renderable) -> None:
+    """Show ``renderable`` through the system pager, without ANSI styles."""
+    # plain ``less`` without -R would show styled output as escape codes
+    with _console.pager(styles=False):
+        _console.print(renderable)
+
+
+async def _gather(*calls) -> list:
+    """Await every zero-argument coroutine function concurrently.
+
+    Runs in an anyio task group so cancellation (e.g. Ctrl-C) is absorbed by
+    the surrounding cancel scope. Returns the results in call order; a call
+    that raised contributes its exception instead.
+    """
+    results = [None] * len(calls)
+
+    async def run_one(index, call):
+        try:
+            results[index] = await call()
+        except Exception as e:
+            results[index] = e
+
+    async with anyio.create_task_group() as tg:
+        for index, call in enumerate(calls):
+            tg.start_soon(run_one, index, call)
+    return results
+
+
+class _ResourceItem:
+    """A resource entry that is only encoded when rich renders it."""
+
+    def __init__(self, resource):
+        self.resource = resource
+
+    def __rich_console__(self, console, options):
+        Markdown, _ = _rich()
+        if isinstance(self.resource, dict):
+            json_str = orjson.dumps(self.resource, option=orjson.OPT_INDENT_2).decode()
+            yield Markdown(f"```json\n{json_str}\n```")
+        else:
+            yield Markdown(f"- {self.resource}")
+
+
+async def _cmd_ping(server_streams: List[tuple]) -> bool:
+    """Ping every server and report which ones respond."""
+    Markdown, Panel = _rich()
+    _console.print(_STATUS_PING)
+    results = await _gather(
+        *(functools.partial(send_ping, rs, ws) for rs, ws in server_streams)
+    )
+    panels = []
+    for i, result in enumerate(results):
+        server_num = i + 1
+        if result is True:
+            ping_md = _PING_OK_MD.format(server_num=server_num)
+            panels.append(Panel(Markdown(ping_md), style="bold green"))
+        else:
+            ping_md = _PING_FAILED_MD.format(server_num=server_num)
+            panels.append(Panel(Markdown(ping_md), style="bold red"))
+    _console.print(Group(*panels))
+    return True
 
-async def handle_command(command: str, server_streams: List[tuple]) -> bool:
-    """Handle specific commands dynamically with multiple servers."""
-    try:
-        if command == "ping":
-            print("[cyan]\nPinging Servers...[/cyan]")
-            for i, (read_stream, write_stream) in enumerate(server_streams):
-                result = await send_ping(read_stream, write_stream)
-                server_num = i + 1
-                if result:
-                    ping_md = f"## Server {server_num} Ping Result\n\n✅ **Server is up and running**"
-                    print(Panel(Markdown(ping_md), style="bold green"))
-                else:
-                    ping_md = f"## Server {server_num} Ping Result\n\n❌ **Server ping failed**"
-                    print(Panel(Markdown(ping_md), style="bold red"))
-
-        elif command == "list-tools":
-            print("[cyan]\nFetching Tools List from all servers...[/cyan]")
-            for i, (read_stream, write_stream) in enumerate(server_streams):
-                response = await send_tools_list(read_stream, write_stream)
-                tools_list = response.get("tools", [])
-                server_num = i + 1
-
-                if not tools_list:
-                    tools_md = (
-                        f"## Server {server_num} Tools List\n\nNo tools available."
-                    )
-                else:
-                    tools_md = f"## Server {server_num} Tools List\n\n" + "\n".join(
-                        [
-                            f"- **{t.get('name')}**: {t.get('description', 'No description')}"
-                            for t in tools_list
-                        ]
-                    )
-                print(
-                    Panel(
-                        Markdown(tools_md),
-                        title=f"Server {server_num} Tools",
-                        style="bold cyan",
-                    )
-                )
 
-        elif command == "call-tool":
-            tool_name = Prompt.ask(
-                "[bold magenta]Enter tool name[/bold magenta]"
-            ).strip()
-            if not tool_name:
-                print("[red]Tool name cannot be empty.[/red]")
-                return True
-
-            arguments_str = Prompt.ask(
-                "[bold magenta]Enter tool arguments as JSON (e.g., {'key': 'value'})[/bold magenta]"
-            ).strip()
-            try:
-                arguments = json.loads(arguments_str)
-            except json.JSONDecodeError as e:
-                print(f"[red]Invalid JSON arguments format:[/red] {e}")
-                return True
-
-            print(f"[cyan]\nCalling tool '{tool_name}' with arguments:\n[/cyan]")
-            print(
-                Panel(
-                    Markdown(f"```json\n{json.dumps(arguments, indent=2)}\n```"),
-                    style="dim",
+async def _cmd_list_tools(server_streams: List[tuple]) -> bool:
+    """List the tools exposed by each server."""
+    Markdown, Panel = _rich()
+    _console.print(_STATUS_TOOLS)
+    responses = await _gather(
+        *(functools.partial(send_tools_list, rs, ws) for rs, ws in server_streams)
+    )
+    panels = []
+    for i, response in enumerate(responses):
+        if isinstance(response, Exception):
+            panels.append(
+                Text.assemble(
+                    (f"Server {i + 1} failed to list tools: ", "red"),
+                    str(response),
                 )
             )
+            continue
+        tools_list = response.get("tools", [])
+        server_num = i + 1
 
-            result = await send_call_tool(tool_name, arguments, server_streams)
-            if result.get("isError"):
-                print(f"[red]Error calling tool:[/red] {result.get('error')}")
-            else:
-                response_content = result.get("content", "No content")
-                print(
-                    Panel(
-                        Markdown(f"### Tool Response\n\n{response_content}"),
-                        style="green",
-                    )
-                )
+        if not tools_list:
+            tools_md = (
+                f"## Server {server_num} Tools List\n\nNo tools available."
+            )
+        else:
+            buf = io.StringIO()
+            buf.write(f"## Server {server_num} Tools List\n\n")
+            # every MCP tool has a name; only the description is optional
+            buf.writelines(
+                f"- **{t['name']}**: {t.get('description', 'No description')}\n"
+                for t in tools_list
+            )
+            tools_md = buf.getvalue()
+        panels.append(
+            Panel(
+                Markdown(tools_md),
+                title=f"Server {server_num} Tools",
+                style="bold cyan",
+            )
+        )
+    _console.print(Group(*panels))
+    return True
 
-        elif command == "list-resources":
-            print("[cyan]\nFetching Resources List from all servers...[/cyan]")
-            for i, (read_stream, write_stream) in enumerate(server_streams):
-                response = await send_resources_list(read_stream, write_stream)
-                resources_list = response.get("resources", []) if response else None
-                server_num = i + 1
 
-                if not resources_list:
-                    resources_md = f"## Server {server_num} Resources List\n\nNo resources available."
-                else:
-                    resources_md = f"## Server {server_num} Resources List\n"
-                    for r in resources_list:
-                        if isinstance(r, dict):
-                            json_str = json.dumps(r, indent=2)
-                            resources_md += f"\n```json\n{json_str}\n```"
-                        else:
-                            resources_md += f"\n- {r}"
-                print(
-                    Panel(
-                        Markdown(resources_md),
-                        title=f"Server {server_num} Resources",
-                        style="bold cyan",
-                    )
-                )
+async def _cmd_call_tool(server_streams: List[tuple]) -> bool:
+    """Prompt for a tool name and JSON arguments, then call the tool."""
+    Markdown, Panel = _rich()
+    tool_name = (await get_input(_TOOL_NAME_PROMPT)).strip()
+    if not tool_name:
+        print("[red]Tool name cannot be empty.[/red]")
+        return True
 
-        elif command == "list-prompts":
-            print("[cyan]\nFetching Prompts List from all servers...[/cyan]")
-            for i, (read_stream, write_stream) in enumerate(server_streams):
-                response = await send_prompts_list(read_stream, write_stream)
-                prompts_list = response.get("prompts", [])
-                server_num = i + 1
+    arguments_str = (await get_input(_TOOL_ARGS_PROMPT)).strip()
+    try:
+        arguments = orjson.loads(arguments_str)
+    except orjson.JSONDecodeError as e:
+        print(f"[red]Invalid JSON arguments format:[/red] {e}")
+        return True
+
+    print(f"[cyan]\nCalling tool '{tool_name}' with arguments:\n[/cyan]")
+    # large payloads are shown as typed rather than encoded a second time
+    if len(arguments_str) < _PRETTY_ARGS_LIMIT:
+        arguments_json = orjson.dumps(arguments, option=orjson.OPT_INDENT_2).decode()
+    else:
+        arguments_json = arguments_str
+    print(Panel(Markdown(f"```json\n{arguments_json}\n```"), style="dim"))
 
-                if not prompts_list:
-                    prompts_md = (
-                        f"## Server {server_num} Prompts List\n\nNo prompts available."
-                    )
-                else:
-                    prompts_md = f"## Server {server_num} Prompts List\n\n" + "\n".join(
-                        [f"- {p}" for p in prompts_list]
-                    )
-                print(
-                    Panel(
-                        Markdown(prompts_md),
-                        title=f"Server {server_num} Prompts",
-                        style="bold cyan",
-                    )
-                )
+    result = await send_call_tool(tool_name, arguments, server_streams)
+    if result.get("isError"):
+        print(f"[red]Error calling tool:[/red] {result.get('error')}")
+    else:
+        response_content = result.get("content", "No content")
+        print(
+            Panel(
+                Markdown(f"### Tool Response\n\n{response_content}"),
+                style="green",
+            )
+        )
+    return True
 
-        elif command == "chat":
-            provider = os.getenv("LLM_PROVIDER", "openai")
-            model = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
-            # Clear the screen first
-            if sys.platform == "win32":
-                os.system("cls")
-            else:
-                os.system("clear")
+async def _cmd_list_resources(server_streams: List[tuple]) -> bool:
+    """List the resources exposed by each server."""
+    Markdown, Panel = _rich()
+    _console.print(_STATUS_RESOURCES)
+    responses = await _gather(
+        *(functools.partial(send_resources_list, rs, ws) for rs, ws in server_streams)
+    )
+    panels = []
+    item_count = 0
+    for i, response in enumerate(responses):
+        if isinstance(response, Exception):
+            panels.append(
+                Text.assemble(
+                    (f"Server {i + 1} failed to list resources: ", "red"),
+                    str(response),
+                )
+            )
+            continue
+        resources_list = response.get("resources", []) if response else None
+        server_num = i + 1
 
-            chat_info_text = (
-                "Welcome to the Chat!\n\n"
-                f"**Provider:** {provider}  |  **Model:** {model}\n\n"
-                "Type 'exit' to quit."
+        if not resources_list:
+            resources_md = f"## Server {server_num} Resources List\n\nNo resources available."
+            body = Markdown(resources_md)
+        else:
+            body = Group(
+                Markdown(f"## Server {server_num} Resources List"),
+                *(_ResourceItem(r) for r in resources_list),
+            )
+            item_count += len(resources_list)
+        panels.append(
+            Panel(
+                body,
+                title=f"Server {server_num} Resources",
+                style="bold cyan",
             )
+        )
 
-            print(
-                Panel(
-                    Markdown(chat_info_text),
-                    style="bold cyan",
-                    title="Chat Mode",
-                    title_align="center",
+    # every resource takes at least a line, so this many won't fit on screen
+    if _console.is_terminal and item_count > _console.height:
+        # the pager is a blocking subprocess, so keep it off the event loop
+        await anyio.to_thread.run_sync(_page, Group(*panels))
+    else:
+        _console.print(Group(*panels))
+    return True
+
+
+async def _cmd_list_prompts(server_streams: List[tuple]) -> bool:
+    """List the prompts exposed by each server."""
+    Markdown, Panel = _rich()
+    _console.print(_STATUS_PROMPTS)
+    responses = await _gather(
+        *(functools.partial(send_prompts_list, rs, ws) for rs, ws in server_streams)
+    )
+    panels = []
+    for i, response in enumerate(responses):
+        if isinstance(response, Exception):
+            panels.append(
+                Text.assemble(
+                    (f"Server {i + 1} failed to list prompts: ", "red"),
+                    str(response),
                 )
             )
-            await handle_chat_mode(server_streams, provider, model)
+            continue
+        prompts_list = response.get("prompts", [])
+        server_num = i + 1
 
-        elif command in ["quit", "exit"]:
-            print("\n[bold red]Goodbye![/bold red]")
-            return False
+        if not prompts_list:
+            prompts_md = (
+                f"## Server {server_num} Prompts List\n\nNo prompts available."
+            )
+        else:
+            buf = io.StringIO()
+            buf.write(f"## Server {server_num} Prompts List\n\n")
+            buf.writelines(f"- {p}\n" for p in prompts_list)
+            prompts_md = buf.getvalue()
+        panels.append(
+            Panel(
+                Markdown(prompts_md),
+                title=f"Server {server_num} Prompts",
+                style="bold cyan",
+            )
+        )
+    _console.print(Group(*panels))
+    return True
 
-        elif command == "clear":
-            if sys.platform == "win32":
-                os.system("cls")
-            else:
-                os.system("clear")
 
-        elif command == "help":
-            help_md = """
-# Available Commands
+async def _cmd_chat(server_streams: List[tuple]) -> bool:
+    """Enter chat mode with the configured LLM provider."""
+    provider = os.getenv("LLM_PROVIDER", "openai")
+    model = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
-- **ping**: Check if server is responsive
-- **list-tools**: Display available tools
-- **list-resources**: Display available resources
-- **list-prompts**: Display available prompts
-- **chat**: Enter chat mode
-- **clear**: Clear the screen
-- **help**: Show this help message
-- **quit/exit**: Exit the program
+    # Clear the screen first
+    _clear()
 
-**Note:** Commands use dashes (e.g., `list-tools` not `list tools`).
-"""
-            print(Panel(Markdown(help_md), style="yellow"))
+    print(_chat_banner(provider, model))
 
-        else:
-            print(f"[red]\nUnknown command: {command}[/red]")
-            print("[yellow]Type 'help' for available commands[/yellow]")
-    except Exception as e:
-        print(f"\n[red]Error executing command:[/red] {e}")
+    # the chat handler pulls in the LLM provider SDKs, so load it on demand
+    from mcpcli.chat_handler import handle_chat_mode
 
+    await handle_chat_mode(server_streams, provider, model)
     return True
 
 
-async def get_input():
-    """Get input asynchronously."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: input().strip().lower())
+async def _cmd_quit(server_streams: List[tuple]) -> bool:
+    """Leave interactive mode."""
+    print("\n[bold red]Goodbye![/bold red]")
+    return False
+
+
+async def _cmd_clear(server_streams: List[tuple]) -> bool:
+    """Clear the screen."""
+    _clear()
+    return True
+
+
+async def _cmd_help(server_streams: List[tuple]) -> bool:
+    """Show the available commands."""
+    print(_help_panel())
+    return True
+
+
+# Interactive and single-command handlers, keyed by command name
+_DISPATCH: Dict[str, Callable[[List[tuple]], Awaitable[bool]]] = {
+    "ping": _cmd_ping,
+    "list-tools": _cmd_list_tools,
+    "call-tool": _cmd_call_tool,
+    "list-resources": _cmd_list_resources,
+    "list-prompts": _cmd_list_prompts,
+    "chat": _cmd_chat,
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "clear": _cmd_clear,
+    "help": _cmd_help,
+}
+
+
+async def handle_command(command: str, server_streams: List[tuple]) -> bool:
+    """Handle specific commands dynamically with multiple servers."""
+    handler = _DISPATCH.get(command)
+    if handler is None:
+        print(f"[red]\nUnknown command: {command}[/red]")
+        print("[yellow]Type 'help' for available commands[/yellow]")
+        return True
+
+    try:
+        return await handler(server_streams)
+    except Exception as e:
+        print(f"\n[red]Error executing command:[/red] {e}")
+
+    return True
 
 
 async def interactive_mode(server_streams: List[tuple]):
     """Run the CLI in interactive mode with multiple servers."""
-    welcome_text = """
-# Welcome to the Interactive MCP Command-Line Tool (Multi-Server Mode)
-
-Type 'help' for available commands or 'quit' to exit.
-"""
-    print(Panel(Markdown(welcome_text), style="bold cyan"))
+    print(_welcome_panel())
 
     while True:
         try:
-            command = Prompt.ask("[bold green]\n>[/bold green]").strip().lower()
+            command = (await get_input(_COMMAND_PROMPT)).strip().lower()
             if not command:
                 continue
             should_continue = await handle_command(command, server_streams)
@@ -268,66 +462,132 @@ Type 'help' for available commands or 'quit' to exit.
                 return
         except EOFError:
             break
+        except KeyboardInterrupt:
+            # prompt_toolkit reports Ctrl-C as KeyboardInterrupt
+            print("\n[bold red]Goodbye![/bold red]")
+            break
         except Exception as e:
             print(f"\n[red]Error:[/red] {e}")
 
 
-class GracefulExit(Exception):
-    """Custom exception for handling graceful exits."""
+def _prewarm():
+    """Render a throwaway panel so markdown-it and Pygments caches are warm."""
+    Markdown, Panel = _rich()
+    console = Console(file=io.StringIO())
+    console.print(Panel(Markdown("# x\n\n```python\npass\n```")))
 
-    pass
+
+@asynccontextmanager
+async def _cancel_on_interrupt():
+    """Yield a cancel scope that Ctrl-C cancels, so cleanup still runs."""
+    session = anyio.CancelScope()
+
+    async def watch(*, task_status=anyio.TASK_STATUS_IGNORED):
+        with anyio.open_signal_receiver(signal.SIGINT) as signals:
+            task_status.started()
+            # keep listening so repeated Ctrl-C presses during shutdown are ignored
+            async for _ in signals:
+                if not session.cancel_called:
+                    print("\n[bold red]Goodbye![/bold red]")
+                    session.cancel()
+
+    async with anyio.create_task_group() as tg:
+        # asyncio does not support signal handlers on Windows
+        if sys.platform != "win32":
+            await tg.start(watch)
+        try:
+            yield session
+        finally:
+            tg.cancel_scope.cancel()
+
+
+async def _hold_open(cm, shutdown: anyio.Event, *, task_status=anyio.TASK_STATUS_IGNORED):
+    """Keep a transport open in its own task until shutdown is set.
+
+    The transports start an anyio task group on entry, which must be exited
+    from the task that entered it, so entry and exit both happen here.
+    """
+    with anyio.CancelScope() as scope:
+        async with cm as (read_stream, write_stream):
+            task_status.started((read_stream, write_stream))
+            await shutdown.wait()
+
+            # let the transport wind down, but give up after 1 second
+            await write_stream.aclose()
+            scope.deadline = anyio.current_time() + 1
 
 
 async def run(config_path: str, server_names: List[str], command: str = None) -> None:
     """Main function to manage server initialization, communication, and shutdown."""
     # Clear screen before rendering anything
-    if sys.platform == "win32":
-        os.system("cls")
-    else:
-        os.system("clear")
+    _clear()
 
-    # Load server configurations and establish connections for all servers
-    server_streams = []
-    context_managers = []
-    client = None
+    # Load server configurations up front so config errors surface unwrapped
+    servers = []
     for server_name in server_names:
-        server_params = await load_config(config_path, server_name)
-
-        # Establish stdio or sse communication for each server
-        if isinstance(server_params, StdioServerParameters):
-            cm = stdio_client(server_params)
-            (read_stream, write_stream) = await cm.__aenter__()
-            context_managers.append(cm)
-            server_streams.append((read_stream, write_stream))
-
-            init_result = await send_initialize(read_stream, write_stream)
-            if not init_result:
-                print(f"[red]Server initialization failed for {server_name}[/red]")
-                return
-        elif isinstance(server_params, SSEServerParameters):
-            client = sse_client(server_params.endpoint)
-            (read_stream, write_stream) = await client.__aenter__()
-            context_managers.append(client)
-            server_streams.append((read_stream, write_stream))
+        servers.append((server_name, await load_config(config_path, server_name)))
+
+    # Establish connections for all servers. Each transport is held open by
+    # its own task so they can all be closed at the same time on the way out.
+    server_streams = []
+    shutdown = anyio.Event()
+    async with _cancel_on_interrupt() as session, anyio.create_task_group() as tg:
+        try:
+            with session:
+                for _, server_params in servers:
+                    # Establish communication over the server's own transport
+                    (read_stream, write_stream) = await tg.start(
+                        _hold_open, server_params.open_client(), shutdown
+                    )
+                    server_streams.append((read_stream, write_stream))
+
+                # The servers are all started by now, so let them boot side by
+                # side and wait for their initialize handshakes together
+                init_results = await _gather(
+                    *(
+                        functools.partial(server_params.initialize, rs, ws)
+                        for (_, server_params), (rs, ws) in zip(servers, server_streams)
+                    )
+                )
+                for (server_name, _), init_result in zip(servers, init_results):
+                    if isinstance(init_result, Exception):
+                        raise init_result
+                    if not init_result:
+                        print(f"[red]Server initialization failed for {server_name}[/red]")
+                        return
+
+                if command:
+                    # Single command mode
+                    await handle_command(command, server_streams)
+                else:
+                    # Interactive mode
+                    await interactive_mode(server_streams)
+        finally:
+            # Clean up all streams
+            shutdown.set()
+
+
+def _leaf_exceptions(error: BaseException):
+    """Yield the individual exceptions inside (possibly nested) exception groups."""
+    if isinstance(error, BaseExceptionGroup):
+        for inner in error.exceptions:
+            yield from _leaf_exceptions(inner)
+    else:
+        yield error
 
-        else:
-            raise ValueError("Server transport not supported")
 
+def _backend_options() -> dict:
+    """Run the asyncio backend on uvloop when it is installed."""
     try:
-        if command:
-            # Single command mode
-            await handle_command(command, server_streams)
-        else:
-            # Interactive mode
-            await interactive_mode(server_streams)
-    finally:
-        # Clean up all streams
-        for cm in context_managers:
-            with anyio.move_on_after(1):  # wait up to 1 second
-                await cm.__aexit__()
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    return {"use_uvloop": True}
 
-def cli_main():
-    # setup the parser
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once per process."""
     parser = argparse.ArgumentParser(description="MCP Command-Line Tool")
 
     parser.add_argument(
@@ -347,13 +607,13 @@ def cli_main():
     parser.add_argument(
         "command",
         nargs="?",
-        choices=["ping", "list-tools", "list-resources", "list-prompts"],
+        choices=_COMMAND_CHOICES,
         help="Command to execute (optional - if not provided, enters interactive mode).",
     )
 
     parser.add_argument(
         "--provider",
-        choices=["openai", "ollama","amazon"],
+        choices=_PROVIDER_CHOICES,
         default="openai",
         help="LLM provider to use. Defaults to 'openai'.",
     )
@@ -369,22 +629,39 @@ def cli_main():
         help=("AWS region to use. Defaults to 'us-east-1'."),
     )
 
-    args = parser.parse_args()
+    return parser
 
-    model = args.model or (
-        "gpt-4o-mini" if args.provider == "openai" 
-        else "claude-3.5-sonnet" if args.provider == "amazon"
-        else "qwen2.5-coder"
-    )
+
+def cli_main():
+    args = _build_parser().parse_args()
+
+    model = args.model or _DEFAULT_MODELS[args.provider]
     os.environ["LLM_PROVIDER"] = args.provider
     os.environ["LLM_MODEL"] = model
     os.environ["AWS_REGION"] = args.aws_region 
 
+    # an empty system() call switches the Windows console to VT mode so the
+    # ANSI clear sequence is honoured there too
+    if sys.platform == "win32":
+        os.system("")
+
+    # warm up the rich rendering stack while servers are starting
+    threading.Thread(target=_prewarm, daemon=True).start()
+
     try:
-        result = anyio.run(run, args.config_file, args.servers, args.command)
+        result = anyio.run(
+            run,
+            args.config_file,
+            args.servers,
+            args.command,
+            backend="asyncio",
+            backend_options=_backend_options(),
+        )
         sys.exit(result)
     except Exception as e:
-        print(f"[red]Error occurred:[/red] {e}")
+        # errors raised inside run()'s task groups arrive wrapped in a group
+        for error in _leaf_exceptions(e):
+            print(f"[red]Error occurred:[/red] {error}")
         sys.exit(1)
 
 
@@ -1,12 +1,14 @@
 # chat_handler.py
+import asyncio
 import json
+import threading
 from datetime import datetime
 
 from rich import print
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.prompt import Prompt
 
+from mcpcli.input_handler import get_input
 from mcpcli.llm_client import LLMClient
 from mcpcli.system_prompt_generator import SystemPromptGenerator
 from mcpcli.tools_handler import convert_to_openai_tools, fetch_tools, handle_tool_call
@@ -33,7 +35,9 @@ async def handle_chat_mode(server_streams, provider="openai", model="gpt-4o-mini
         while True:
             try:
                 # Change prompt to yellow
-                user_message = Prompt.ask("[bold yellow]>[/bold yellow]").strip()
+                user_message = (
+                    await get_input([("ansiyellow bold", ">"), ("", " ")])
+                ).strip()
                 if user_message.lower() in ["exit", "quit"]:
                     print(Panel("Exiting chat mode.", style="bold red"))
                     break
@@ -47,6 +51,10 @@ async def handle_chat_mode(server_streams, provider="openai", model="gpt-4o-mini
                     client, conversation_history, openai_tools, server_streams
                 )
 
+            except (EOFError, KeyboardInterrupt):
+                # Ctrl-D / Ctrl-C at the prompt leaves chat mode
+                print(Panel("Exiting chat mode.", style="bold red"))
+                break
             except Exception as e:
                 print(f"[red]Error processing message:[/red] {e}")
                 continue
@@ -54,12 +62,46 @@ async def handle_chat_mode(server_streams, provider="openai", model="gpt-4o-mini
         print(f"[red]Error in chat mode:[/red] {e}")
 
 
+async def _run_in_daemon_thread(func, *args, **kwargs):
+    """Run a blocking call in a daemon thread and await its result.
+
+    LLM completions can take tens of seconds (or hang), so they must not
+    block the event loop, or Ctrl-C is not seen until they return. The
+    thread is a daemon so an abandoned call does not hold up exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, error):
+        # the await may have been cancelled while the call was running
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def call():
+        try:
+            result, error = func(*args, **kwargs), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            # the loop has already been closed
+            pass
+
+    threading.Thread(target=call, daemon=True).start()
+    return await future
+
+
 async def process_conversation(
     client, conversation_history, openai_tools, server_streams
 ):
     """Process the conversation loop, handling tool calls and responses."""
     while True:
-        completion = client.create_completion(
+        completion = await _run_in_daemon_thread(
+            client.create_completion,
             messages=conversation_history,
             tools=openai_tools,
         )
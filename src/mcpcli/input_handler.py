@@ -0,0 +1,22 @@
+# input_handler.py
+import functools
+
+
+@functools.cache
+def prompt_session():
+    """Return the shared prompt_toolkit session, created on first use."""
+    # prompt_toolkit is only needed once we actually read from the terminal
+    from prompt_toolkit import PromptSession
+
+    return PromptSession()
+
+
+async def get_input(message) -> str:
+    """Read a line from the user without blocking the event loop.
+
+    ``message`` is prompt_toolkit formatted text, e.g. a list of
+    ``(style, text)`` tuples.
+    """
+    # SIGINT is left to the CLI's own signal receiver; Ctrl-C at the prompt
+    # still arrives as KeyboardInterrupt through the key binding
+    return await prompt_session().prompt_async(message, handle_sigint=False)
@@ -0,0 +1,53 @@
+import os
+import signal
+import sys
+import threading
+import time
+import anyio
+import pytest
+from unittest.mock import Mock
+from mcpcli import __main__ as main
+from mcpcli.chat_handler import process_conversation, _run_in_daemon_thread
+
+def _slow_completion(**kwargs):
+    # Stand-in for a provider that takes a long time to answer
+    time.sleep(3)
+    return {"response": "late"}
+
+@pytest.mark.asyncio
+async def test_run_in_daemon_thread_returns_result():
+    assert await _run_in_daemon_thread(lambda a, b=0: a + b, 1, b=2) == 3
+
+@pytest.mark.asyncio
+async def test_run_in_daemon_thread_raises_error():
+    def fail():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError, match="bad"):
+        await _run_in_daemon_thread(fail)
+
+@pytest.mark.asyncio
+async def test_run_in_daemon_thread_cancel_does_not_wait():
+    start = time.monotonic()
+    with anyio.move_on_after(0.2):
+        await _run_in_daemon_thread(_slow_completion)
+    assert time.monotonic() - start < 1
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no SIGINT handlers on Windows")
+@pytest.mark.asyncio
+async def test_sigint_interrupts_blocking_completion():
+    # Ctrl-C must cancel the session while the completion is still running
+    client = Mock(provider="openai")
+    client.create_completion.side_effect = _slow_completion
+    history = [{"role": "user", "content": "hi"}]
+    timer = threading.Timer(0.3, os.kill, (os.getpid(), signal.SIGINT))
+
+    start = time.monotonic()
+    async with main._cancel_on_interrupt() as session:
+        with session:
+            timer.start()
+            await process_conversation(client, history, [], [])
+
+    assert session.cancelled_caught
+    assert time.monotonic() - start < 2
+    client.create_completion.assert_called_once()
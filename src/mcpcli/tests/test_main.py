@@ -0,0 +1,270 @@
+import functools
+import io
+import os
+import signal
+import sys
+import time
+import anyio
+import pytest
+from unittest.mock import patch, AsyncMock, Mock
+from rich.console import Console
+from mcpcli import __main__ as main
+
+@pytest.mark.asyncio
+async def test_gather_keeps_call_order():
+    # Results line up with the calls even when a later call finishes first
+    async def delayed(value, delay):
+        await anyio.sleep(delay)
+        return value
+
+    results = await main._gather(
+        functools.partial(delayed, "slow", 0.05),
+        functools.partial(delayed, "fast", 0),
+    )
+    assert results == ["slow", "fast"]
+
+@pytest.mark.asyncio
+async def test_gather_returns_exception_in_its_slot():
+    # A failing call must not cancel its siblings
+    error = RuntimeError("boom")
+
+    async def ok():
+        return 1
+
+    async def fail():
+        raise error
+
+    results = await main._gather(ok, fail, ok)
+    assert results == [1, error, 1]
+
+@pytest.mark.asyncio
+async def test_gather_no_calls():
+    assert await main._gather() == []
+
+def test_build_parser_defaults():
+    args = main._build_parser().parse_args([])
+    assert args.provider == "openai"
+    assert args.model is None
+    assert args.servers == []
+    assert args.command is None
+    assert main._DEFAULT_MODELS[args.provider] == "gpt-4o-mini"
+
+def test_build_parser_provider_choices():
+    # The accepted providers are exactly the ones with a default model
+    parser = main._build_parser()
+    for provider, model in main._DEFAULT_MODELS.items():
+        args = parser.parse_args(["--provider", provider, "--server", "a", "--server", "b", "ping"])
+        assert args.provider == provider
+        assert args.servers == ["a", "b"]
+        assert args.command == "ping"
+        assert (args.model or main._DEFAULT_MODELS[args.provider]) == model
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--provider", "unknown"])
+
+@pytest.mark.asyncio
+async def test_handle_command_dispatches_to_handler():
+    # handle_command should look the command up and return the handler's result
+    mock_handler = AsyncMock(return_value=True)
+    server_streams = [("read", "write")]
+
+    with patch.dict(main._DISPATCH, {"ping": mock_handler}):
+        assert await main.handle_command("ping", server_streams) is True
+        mock_handler.assert_awaited_once_with(server_streams)
+
+@pytest.mark.asyncio
+async def test_handle_command_unknown():
+    # Unknown commands are reported but keep the interactive loop running
+    with patch("mcpcli.__main__.print") as mock_print:
+        assert await main.handle_command("no-such-command", []) is True
+        assert "Unknown command: no-such-command" in mock_print.call_args_list[0].args[0]
+
+@pytest.mark.asyncio
+async def test_handle_command_quit():
+    # Both quit and exit end the interactive loop
+    assert await main.handle_command("quit", []) is False
+    assert await main.handle_command("exit", []) is False
+
+@pytest.mark.asyncio
+async def test_handle_command_handler_error():
+    # A failing handler is reported and the loop keeps going
+    mock_handler = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with patch.dict(main._DISPATCH, {"ping": mock_handler}), patch("mcpcli.__main__.print") as mock_print:
+        assert await main.handle_command("ping", []) is True
+        assert "boom" in mock_print.call_args_list[0].args[0]
+
+def test_dispatch_covers_command_choices():
+    # Every command the parser accepts must have a handler
+    assert set(main._COMMAND_CHOICES) <= set(main._DISPATCH)
+
+def _render(renderable):
+    console = Console(file=io.StringIO(), width=80, color_system=None)
+    console.print(renderable)
+    return console.file.getvalue()
+
+def test_resource_item_renders_dict_as_json():
+    output = _render(main._ResourceItem({"uri": "file:///a.txt", "name": "a"}))
+    assert '"uri": "file:///a.txt"' in output
+    assert '"name": "a"' in output
+
+def test_resource_item_renders_other_as_bullet():
+    output = _render(main._ResourceItem("file:///a.txt"))
+    assert "file:///a.txt" in output
+    assert "{" not in output
+
+async def _call_tool_arguments_shown(arguments_str):
+    # Run call-tool with the given typed arguments and return the JSON it displayed
+    mock_get_input = AsyncMock(side_effect=["echo", arguments_str])
+    mock_send_call_tool = AsyncMock(return_value={"content": "ok"})
+
+    with patch("mcpcli.__main__.get_input", new=mock_get_input), \
+            patch("mcpcli.__main__.send_call_tool", new=mock_send_call_tool), \
+            patch("mcpcli.__main__.print") as mock_print:
+        assert await main._cmd_call_tool([]) is True
+
+    mock_send_call_tool.assert_awaited_once()
+    # the arguments panel is printed right after the "Calling tool" line
+    arguments_panel = mock_print.call_args_list[1].args[0]
+    return arguments_panel.renderable.markup
+
+@pytest.mark.asyncio
+async def test_call_tool_pretty_prints_small_arguments():
+    shown = await _call_tool_arguments_shown('{"text":"hi"}')
+    assert '{\n  "text": "hi"\n}' in shown
+
+@pytest.mark.asyncio
+async def test_call_tool_shows_large_arguments_as_typed():
+    arguments_str = '{"text":"' + "x" * main._PRETTY_ARGS_LIMIT + '"}'
+    shown = await _call_tool_arguments_shown(arguments_str)
+    assert arguments_str in shown
+
+@pytest.mark.asyncio
+async def test_call_tool_invalid_json():
+    mock_get_input = AsyncMock(side_effect=["echo", "{not json"])
+    mock_send_call_tool = AsyncMock()
+
+    with patch("mcpcli.__main__.get_input", new=mock_get_input), \
+            patch("mcpcli.__main__.send_call_tool", new=mock_send_call_tool), \
+            patch("mcpcli.__main__.print"):
+        assert await main._cmd_call_tool([]) is True
+    mock_send_call_tool.assert_not_awaited()
+
+class _FakeTransport:
+    """Transport context manager that records how it was closed."""
+
+    def __init__(self, hang_on_exit=False):
+        self.write_stream, self.read_stream = anyio.create_memory_object_stream(1)
+        self.hang_on_exit = hang_on_exit
+        self.entered = False
+        self.exited = False
+
+    async def __aenter__(self):
+        self.entered = True
+        return (self.read_stream, self.write_stream)
+
+    async def __aexit__(self, *exc_info):
+        try:
+            if self.hang_on_exit:
+                await anyio.sleep_forever()
+        finally:
+            self.exited = True
+
+@pytest.mark.asyncio
+async def test_hold_open_closes_transport_on_shutdown():
+    # The transport stays open until shutdown, then sees its input close
+    shutdown = anyio.Event()
+    transport = _FakeTransport()
+
+    async with anyio.create_task_group() as tg:
+        read_stream, write_stream = await tg.start(main._hold_open, transport, shutdown)
+        assert (read_stream, write_stream) == (transport.read_stream, transport.write_stream)
+        await anyio.sleep(0.05)
+        assert not transport.exited
+        shutdown.set()
+
+    assert transport.exited
+    with pytest.raises(anyio.EndOfStream):
+        await transport.read_stream.receive()
+
+@pytest.mark.asyncio
+async def test_hold_open_gives_up_on_hanging_exit():
+    # A transport that never finishes closing is abandoned after about 1 s
+    shutdown = anyio.Event()
+    transport = _FakeTransport(hang_on_exit=True)
+
+    async with anyio.create_task_group() as tg:
+        await tg.start(main._hold_open, transport, shutdown)
+        start = time.monotonic()
+        shutdown.set()
+
+    assert transport.exited
+    assert 0.9 <= time.monotonic() - start < 2
+
+def test_leaf_exceptions_flattens_nested_groups():
+    inner, other, plain = ValueError("a"), KeyError("b"), RuntimeError("c")
+    group = ExceptionGroup("outer", [ExceptionGroup("inner", [inner, other]), plain])
+
+    assert list(main._leaf_exceptions(group)) == [inner, other, plain]
+    assert list(main._leaf_exceptions(plain)) == [plain]
+
+def _fake_servers(*initialize_results):
+    # One fake server per result; initialize returns it, or raises it if it is an exception
+    transports, servers = [], []
+    for result in initialize_results:
+        transport = _FakeTransport()
+        params = Mock()
+        params.open_client.return_value = transport
+        if isinstance(result, Exception):
+            params.initialize = AsyncMock(side_effect=result)
+        else:
+            params.initialize = AsyncMock(return_value=result)
+        transports.append(transport)
+        servers.append(params)
+    return transports, servers
+
+@pytest.mark.asyncio
+async def test_run_closes_transports_when_initialize_fails():
+    transports, servers = _fake_servers(True, False)
+    mock_interactive_mode = AsyncMock()
+
+    with patch("mcpcli.__main__.load_config", new=AsyncMock(side_effect=servers)), \
+            patch("mcpcli.__main__.interactive_mode", new=mock_interactive_mode), \
+            patch("mcpcli.__main__._clear"), \
+            patch("mcpcli.__main__.print") as mock_print:
+        assert await main.run("config.json", ["a", "b"]) is None
+
+    assert "Server initialization failed for b" in mock_print.call_args_list[0].args[0]
+    mock_interactive_mode.assert_not_awaited()
+    assert all(t.entered and t.exited for t in transports)
+
+@pytest.mark.asyncio
+async def test_run_closes_transports_when_initialize_raises():
+    error = RuntimeError("handshake failed")
+    transports, servers = _fake_servers(error, True)
+
+    with patch("mcpcli.__main__.load_config", new=AsyncMock(side_effect=servers)), \
+            patch("mcpcli.__main__.interactive_mode", new=AsyncMock()), \
+            patch("mcpcli.__main__._clear"):
+        with pytest.raises(BaseException) as exc_info:
+            await main.run("config.json", ["a", "b"])
+
+    assert list(main._leaf_exceptions(exc_info.value)) == [error]
+    assert all(t.entered and t.exited for t in transports)
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no SIGINT handlers on Windows")
+@pytest.mark.asyncio
+async def test_cancel_on_interrupt_cancels_session():
+    # Ctrl-C cancels the session once; further presses are ignored during cleanup
+    with patch("mcpcli.__main__.print") as mock_print:
+        async with main._cancel_on_interrupt() as session:
+            with session:
+                os.kill(os.getpid(), signal.SIGINT)
+                await anyio.sleep(5)
+
+            os.kill(os.getpid(), signal.SIGINT)
+            await anyio.sleep(0.05)
+
+    assert session.cancelled_caught
+    mock_print.assert_called_once()
+    assert "Goodbye" in mock_print.call_args.args[0]
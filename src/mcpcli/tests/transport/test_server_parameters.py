@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch, AsyncMock, sentinel
+from mcpcli.transport.sse.sse_server_parameters import SSEServerParameters
+from mcpcli.transport.stdio.stdio_server_parameters import StdioServerParameters
+
+def test_stdio_open_client():
+    # open_client should hand the parameters themselves to stdio_client
+    params = StdioServerParameters(command="server", args=["--flag"])
+
+    with patch("mcpcli.transport.stdio.stdio_client.stdio_client", return_value=sentinel.cm) as mock_client:
+        assert params.open_client() is sentinel.cm
+        mock_client.assert_called_once_with(params)
+
+def test_sse_open_client():
+    # open_client should connect sse_client to the configured endpoint
+    params = SSEServerParameters(endpoint="http://example.com/sse")
+
+    with patch("mcpcli.transport.sse.sse_client.sse_client", return_value=sentinel.cm) as mock_client:
+        assert params.open_client() is sentinel.cm
+        mock_client.assert_called_once_with("http://example.com/sse")
+
+@pytest.mark.asyncio
+async def test_stdio_initialize_success():
+    # A non-empty initialize result means the handshake succeeded
+    mock_send_initialize = AsyncMock(return_value={"protocolVersion": "2024-11-05"})
+    params = StdioServerParameters(command="server")
+
+    with patch("mcpcli.transport.stdio.stdio_server_parameters.send_initialize", new=mock_send_initialize):
+        assert await params.initialize(sentinel.read, sentinel.write) is True
+        mock_send_initialize.assert_awaited_once_with(sentinel.read, sentinel.write)
+
+@pytest.mark.asyncio
+async def test_stdio_initialize_failure():
+    # send_initialize returns None when the server never answers
+    mock_send_initialize = AsyncMock(return_value=None)
+    params = StdioServerParameters(command="server")
+
+    with patch("mcpcli.transport.stdio.stdio_server_parameters.send_initialize", new=mock_send_initialize):
+        assert await params.initialize(sentinel.read, sentinel.write) is False
+
+@pytest.mark.asyncio
+async def test_sse_initialize():
+    # SSE needs no handshake, so initialize never touches the streams
+    params = SSEServerParameters()
+    assert await params.initialize(None, None) is True
+
+def test_loading_config_does_not_import_httpx():
+    # httpx is only needed once an SSE connection is opened
+    code = "import sys, mcpcli.config; sys.exit('httpx' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)})
+    assert result.returncode == 0
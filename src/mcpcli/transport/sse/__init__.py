@@ -1,5 +1,6 @@
 """SSE (Server-Sent Events) transport implementation."""
 
+# sse_client pulls in httpx, so it is imported from its own module when a
+# connection is actually opened rather than re-exported here
 from .sse_server_parameters import SSEServerParameters
-from .sse_client import sse_client
-__all__ = ["SSEClient", "SSEServerParameters", "SSEServerShutdown"] 
\ No newline at end of file
+__all__ = ["SSEServerParameters"]
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncContextManager, Optional
+
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 @dataclass
 class SSEServerParameters:
@@ -10,4 +12,17 @@ class SSEServerParameters:
     @property
     def url(self) -> str:
         """Return server URL"""
-        return self.endpoint
\ No newline at end of file
+        return self.endpoint
+
+    def open_client(
+        self,
+    ) -> AsyncContextManager[tuple[MemoryObjectReceiveStream, MemoryObjectSendStream]]:
+        """Return the transport context manager for this server."""
+        # imported here so loading the config does not pull in httpx
+        from mcpcli.transport.sse.sse_client import sse_client
+
+        return sse_client(self.endpoint)
+
+    async def initialize(self, read_stream, write_stream) -> bool:
+        """SSE servers are ready as soon as the stream is open."""
+        return True
@@ -28,11 +28,17 @@ async def stdio_client(server: StdioServerParameters):
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
 
     # start the subprocess
-    process = await anyio.open_process(
-        [server.command, *server.args],
-        env={**get_default_environment(), **(server.env or {})},
-        stderr=sys.stderr,
-    )
+    try:
+        process = await anyio.open_process(
+            [server.command, *server.args],
+            env={**get_default_environment(), **(server.env or {})},
+            stderr=sys.stderr,
+        )
+    except FileNotFoundError as exc:
+        # uvloop leaves the path out of the message, so name the command here
+        raise FileNotFoundError(
+            exc.errno, exc.strerror, exc.filename or server.command
+        ) from exc
 
     # started server
     logging.debug(
@@ -1,8 +1,25 @@
 # transport/stdio/stdio_server_parameters.py
 from pydantic import BaseModel, Field
-from typing import Any, Dict, Optional
+from typing import Any, AsyncContextManager, Dict, Optional
+
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from mcpcli.messages.send_initialize_message import send_initialize
 
 class StdioServerParameters(BaseModel):
     command: str
     args: list[str] = Field(default_factory=list)
-    env: Optional[Dict[str, str]] = None
\ No newline at end of file
+    env: Optional[Dict[str, str]] = None
+
+    def open_client(
+        self,
+    ) -> AsyncContextManager[tuple[MemoryObjectReceiveStream, MemoryObjectSendStream]]:
+        """Return the transport context manager for this server."""
+        # imported here as stdio_client imports this module
+        from mcpcli.transport.stdio.stdio_client import stdio_client
+
+        return stdio_client(self)
+
+    async def initialize(self, read_stream, write_stream) -> bool:
+        """Run the MCP initialize handshake over the opened streams."""
+        return bool(await send_initialize(read_stream, write_stream))